@@ -1,15 +1,64 @@
-import urllib.request
-import urllib.error
-import json
+import gzip
+import threading
+import heapq
+import os
+import pickle
+import re
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 from enum import Enum
-from typing import List , Optional, Dict, Tuple
-from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, List , Optional, Dict, Tuple
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from collections import Counter
-import tkinter as tk
-from tkinter import ttk, messagebox
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from dataclasses import dataclass, field, fields
+from collections import OrderedDict
+from operator import attrgetter
+
+#GUI and plotting modules are imported where they're used, so importing this
+#module for Request/stats alone doesn't pay matplotlib's start-up cost
+if TYPE_CHECKING:
+    import http.client
+    from concurrent.futures import ThreadPoolExecutor
+    import tkinter as tk
+    from matplotlib.figure import Figure
+
+
+#created_at placeholder for events without a usable timestamp
+_DT_MIN = datetime.min
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+
+
+def _epoch_seconds(dt: datetime) -> int:
+    #timestamps are naive UTC, so plain subtraction from the naive epoch is exact
+    return (dt - _EPOCH) // _SECOND
+
+
+def _utc_now() -> datetime:
+    #naive UTC, the same convention as the parsed github timestamps
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    #github always sends "YYYY-MM-DDTHH:MM:SSZ", so slice that shape directly
+    #and leave the generic parser for anything else
+    if len(value) == 20 and value[19] == "Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        )
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # normalize to naive datetime to avoid
+    # comparisons between offset-aware and naive values
+    if dt.tzinfo is not None:
+        dt = dt.replace(tzinfo=None)
+    return dt
 
 
 class EventType(Enum):
@@ -21,255 +70,521 @@ class EventType(Enum):
     PULL_REQUEST = "PullRequestEvent"
     FORK = "ForkEvent"
 
+#plain str constants so hot paths compare against a global, not an enum member lookup
+_PUSH = EventType.PUSH.value
+_ISSUES = EventType.ISSUES.value
+_WATCH = EventType.WATCH.value
+_CREATE = EventType.CREATE.value
+_DELETE = EventType.DELETE.value
+_PULL_REQUEST = EventType.PULL_REQUEST.value
+_FORK = EventType.FORK.value
+
+
+#trying to fix mistakes with commits count
+def _push_count(payload: dict, commits_list) -> int:
+    try:
+        count = int(payload.get("size", 1) or 0)
+    except (ValueError, TypeError):
+        count = 0
+    if count <= 0 and isinstance(commits_list, list):
+        count = len(commits_list)
+    return count
+
+
+def _other_count(payload: dict, commits_list) -> int:
+    if not isinstance(commits_list, list):
+        return 0
+    try:
+        return sum(1 for c in commits_list if c.get("distinct", True))
+    except Exception:
+        return 0
+
+
+#event type -> commit counter; everything that is not a push counts distinct commits
+_COMMIT_COUNTERS = {_PUSH: _push_count}
+
+#slots=True makes Python 3.10 the minimum version for this module
+@dataclass(slots=True)
 class GithubEvent:
-    def __init__(self , event_data:dict):
-        self.type = event_data.get("type")
-        self.repo_name = event_data.get("repo" , {}).get("name")
+    type: str
+    repo_name: str
+    created_at: datetime
+    #seconds since the epoch (-1 when unknown), what sorting and filtering compare
+    created_ts: int
+    actor: Optional[str]
+    payload: dict
+    commit_count: int
+    #rendered display strings; only passed in when restoring from the file cache
+    formatted_text: str = field(default="", repr=False, compare=False)
+    formatted_date: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self):
+        #events don't change after parsing, so render the display strings once
+        if not self.formatted_text:
+            self.formatted_text = self._compute_format()
+            self.formatted_date = self._compute_date()
+
+    @classmethod
+    def from_json(cls, event_data: dict) -> "GithubEvent":
+        #missing names become "" so sort keys never have to special-case None
+        event_type = event_data.get("type") or ""
         time_stamp =  event_data.get("created_at")
         if isinstance(time_stamp , str):
             try:
-                #handling github time format 
-                dt = datetime.fromisoformat(time_stamp.replace("Z" , "+00:00"))
-                # normalize to naive datetime to avoid
-                # comparisons between offset-aware and naive values
-                if getattr(dt, "tzinfo", None) is not None:
-                    dt = dt.replace(tzinfo=None)
-                self.created_at = dt
+                created_at = _parse_timestamp(time_stamp)
             except Exception:
-                self.created_at = datetime.min
+                created_at = _DT_MIN
         else:
-            self.created_at = datetime.min
-        self.actor = event_data.get("actor" , {}).get("login")
-        self.payload = event_data.get("payload" ) or {}
-        #trying to fix mistakes with commits count
-        commits_list = self.payload.get("commits")
-        if self.type == EventType.PUSH.value:
-            try:
-              count = int(self.payload.get("size", 1) or 0)
-              if count <= 0 and isinstance(commits_list, list):
-                  count = len(commits_list)
-            except (ValueError, TypeError):
-                  count = len(commits_list) if isinstance(commits_list, list) else 0
-        else:
-            if isinstance(commits_list, list) and commits_list:
-                try:
-                    count = sum(1 for c in commits_list if c.get("distinct", True))
-                except Exception:
-                    count = 0
-            else:
-                count = 0
-        self.commit_count = max(count, 0)
+            created_at = _DT_MIN
+        payload = event_data.get("payload" ) or {}
+        count = _COMMIT_COUNTERS.get(event_type, _other_count)(payload, payload.get("commits"))
+        return cls(
+            type=event_type,
+            repo_name=(event_data.get("repo") or {}).get("name") or "",
+            created_at=created_at,
+            created_ts=-1 if created_at == _DT_MIN else _epoch_seconds(created_at),
+            actor=(event_data.get("actor") or {}).get("login"),
+            payload=payload,
+            commit_count=max(count, 0),
+        )
+
     def format_date(self) -> str:
-        if self.created_at == datetime.min:
+        return self.formatted_date
+    def format(self) -> str:
+        return self.formatted_text
+    def _compute_date(self) -> str:
+        if self.created_at == _DT_MIN:
             return "Unknown date"
         return self.created_at.strftime("%d.%m.%Y %H:%M:%S")
-    def format(self) -> str:
-        #initializing every possible input data "type"
-        if self.type == EventType.PUSH.value: 
-            count = getattr(self , "commit_count" , 0)
-            return f"Pushed {count} commit{'s' if count!=1 else ''} to {self.repo_name}"
-        elif self.type == EventType.ISSUES.value:
-            action = self.payload.get("action", "").capitalize()
-            return f"{action} an issue in {self.repo_name}"
-        elif self.type == EventType.CREATE.value:
-            ref_type = self.payload.get("ref_type" , "repository")
-            return f"Created {ref_type} in {self.repo_name}"
-        elif self.type == EventType.DELETE.value:
-            return f"Deleted a branch in {self.repo_name}"
-        elif self.type == EventType.PULL_REQUEST.value:
-            action = self.payload.get("action" , "").capitalize()
-            return f"{action} a pull request in {self.repo_name}"
-        elif self.type == EventType.WATCH.value:
-            return f"Watched {self.repo_name}"
-        else:
+    def _compute_format(self) -> str:
+        formatter = _FORMATTERS.get(self.type)
+        if formatter is None:
             return f"{self.type} in {self.repo_name}"
-        
-#sorting stuff by field
-class SortStrat: 
-    
-    def sort(self , events : List[GithubEvent]) -> List[GithubEvent]:
-        raise NotImplementedError
+        return formatter(self)
+
+
+def _fmt_push(e: GithubEvent) -> str:
+    count = e.commit_count
+    return f"Pushed {count} commit{'s' if count!=1 else ''} to {e.repo_name}"
 
-class SortByDate(SortStrat):
-    def sort(self , events : List[GithubEvent]) -> List[GithubEvent]:
-        return sorted(events, key=lambda e: e.created_at, reverse=True)
 
-class SortByRepository(SortStrat):
-    def sort(self , events : List[GithubEvent]) -> List[GithubEvent]:
-        return sorted(events , key=lambda e: e.repo_name)
+def _fmt_issues(e: GithubEvent) -> str:
+    action = e.payload.get("action", "").capitalize()
+    return f"{action} an issue in {e.repo_name}"
 
-class SortByType(SortStrat):
-    def sort(self , events : List[GithubEvent]) -> List[GithubEvent]:
-        return sorted(events, key=lambda e: e.type if e.type is not None else "", reverse=False)
+
+def _fmt_create(e: GithubEvent) -> str:
+    ref_type = e.payload.get("ref_type", "repository")
+    return f"Created {ref_type} in {e.repo_name}"
+
+
+def _fmt_delete(e: GithubEvent) -> str:
+    return f"Deleted a branch in {e.repo_name}"
+
+
+def _fmt_pull_request(e: GithubEvent) -> str:
+    action = e.payload.get("action", "").capitalize()
+    return f"{action} a pull request in {e.repo_name}"
+
+
+def _fmt_watch(e: GithubEvent) -> str:
+    return f"Watched {e.repo_name}"
+
+
+#event type -> description; anything else falls back to "<type> in <repo>"
+_FORMATTERS = {
+    _PUSH: _fmt_push,
+    _ISSUES: _fmt_issues,
+    _CREATE: _fmt_create,
+    _DELETE: _fmt_delete,
+    _PULL_REQUEST: _fmt_pull_request,
+    _WATCH: _fmt_watch,
+}
+
+
+#GithubEvent fields in constructor order, used for the columnar file cache
+CACHE_COLUMNS = tuple(f.name for f in fields(GithubEvent))
+
+
+#sorting stuff by field: mode -> (key, newest/largest first)
+SORT_KEYS = {
+    "date": (attrgetter("created_ts"), True),
+    "repo": (attrgetter("repo_name"), False),
+    "type": (attrgetter("type"), False),
+}
+
+
+#github logins: alphanumerics and hyphens, at most 39 chars, not starting with a hyphen
+_LOGIN_RE = re.compile(r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,38})")
+
+
+def is_valid_login(value: str) -> bool:
+    return isinstance(value, str) and _LOGIN_RE.fullmatch(value) is not None
+
+
+def sort_events(events: List[GithubEvent], mode: str) -> List[GithubEvent]:
+    key, reverse = SORT_KEYS[mode]
+    return sorted(events, key=key, reverse=reverse)
 
 
 class Request :
     #reading info from given url and handling some errors 
-    BASE_URL = "https://api.github.com/users"
+    API_HOST = "api.github.com"
+    TIMEOUT = 10
+    REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+    #fetch_many's worker pool, created on first use and kept so that its
+    #threads (and their keep-alive connections) survive between calls
+    MAX_WORKERS = 8
+    _pool: Optional["ThreadPoolExecutor"] = None
+    _pool_lock = threading.Lock()
+    _connections = threading.local()
+    #asking for gzip makes the events payload several times smaller on the wire
+    HEADERS = {
+        "Accept": "application/vnd.github+json",
+        "Accept-Encoding": "gzip",
+        "User-Agent": "github-activity",
+    }
     #setting up caching and time-to-live(TTL) to improve performance
-    memory_cache: Dict[str , Tuple[List[GithubEvent] , datetime]] = {}
-    CACHE_DIR = Path(".cache")
+    #LRU order: least recently used user first, evicted once MAX_USERS is exceeded
+    memory_cache: "OrderedDict[str, Tuple[List[GithubEvent], datetime, Optional[str]]]" = OrderedDict()
+    MAX_USERS = 128
+    memory_lock = threading.Lock()
+    #cache files are pickles, so they must live somewhere only this user can write,
+    #never in the working directory (a checkout could ship a crafted .cache/<login>.pkl)
+    CACHE_DIR = Path.home()/".cache"/"github-activity"
+    #cache files are zstd-compressed when zstandard is installed
+    CACHE_SUFFIX = ".pkl.zst" if zstandard is not None else ".pkl"
     TTL = timedelta(minutes=10)
-    def __init__(self , username : str , sort_strategy: Optional[SortStrat] = None):
+    SERVER_ORDER = "date"
+    #one full page instead of the default 30, so busy accounts still fill the stats period
+    PER_PAGE = 100
+    #events older than this are dropped on fetch, the stats window shows the same period
+    MAX_AGE_DAYS = 30
+    def __init__(self , username : str , sort_mode: str = "date"):
+        #the login ends up in a url and in a cache file name, so nothing but a valid one gets that far
+        if not is_valid_login(username):
+            raise ValueError(f"Invalid GitHub username: {username!r}")
         self.username = username
-        self.url = f"{self.BASE_URL}/{username}/events"
-        self.sortStrategy = sort_strategy or SortByDate()
+        self.path = f"/users/{username}/events?per_page={self.PER_PAGE}"
+        self.sort_mode = sort_mode
         self.events: List[GithubEvent] = []
-        self.CACHE_DIR.mkdir(exist_ok=True)
+        self.cache_path = self.CACHE_DIR/f"{username}{self.CACHE_SUFFIX}"
+        self.temp_path = self.CACHE_DIR/f"{username}{self.CACHE_SUFFIX}.tmp"
+        self.CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.cache_path.resolve().parent != self.CACHE_DIR.resolve():
+            raise ValueError(f"Cache path escapes {self.CACHE_DIR}: {self.cache_path}")
 
 
     
     def fetch(self) -> bool:
         cache_key = self.username
+        #one clock read, so both TTL checks below agree on what "now" is
+        now = datetime.now()
        #checking if the program has already fetched users' info during TTL
-        if cache_key in self.memory_cache:
-            events , cache_time = self.memory_cache[cache_key]
-            if datetime.now() - cache_time < self.TTL:
-                self.events = events
+        with self.memory_lock:
+            cached = self.memory_cache.get(cache_key)
+            if cached and now - cached[1] < self.TTL:
+                self.memory_cache.move_to_end(cache_key)
+                self.events = cached[0]
                 return True
-        file_cache = self.load_from_file_cache()
-        #overwriting cache 
-        if file_cache:
-            self.events = file_cache
-            self.memory_cache [cache_key] = (file_cache , datetime.now())
-            return True 
+        #a stale in-memory entry is revalidated directly, the file cache is only read without one
+        from_file = cached is None
+        if from_file:
+            cached = self.load_from_file_cache()
+            #overwriting cache 
+            if cached and now - cached[1] < self.TTL:
+                self.events = cached[0]
+                self.remember(self.events, cached[2])
+                return True 
+        #a stale cache can still be revalidated: github answers 304 with no body
+        #(and no rate-limit cost) if the events haven't changed since that etag
+        headers = self.HEADERS
+        if cached and cached[2]:
+            headers = {**headers, "If-None-Match": cached[2]}
         try:
-            response = urllib.request.urlopen(self.url)
-            data = json.loads(response.read().decode())
+            status, response_headers, raw = self.http_get(headers)
+            if status == 304 and cached:
+                self.events = cached[0]
+                self.remember(self.events, cached[2])
+                if from_file:
+                    self.save_to_file_cache(self.events, cached[2])
+                return True
+            if status == 404:
+                print(f"Error: User '{self.username}' not found")
+                return False
+            if status != 200:
+                print(f"API Error: {status}")
+                return False
+            if response_headers.get("Content-Encoding") == "gzip":
+                raw = gzip.decompress(raw)
+            data = _json.loads(raw)
+            #the body isn't needed once parsed, free it before the events get built
+            del raw
 
             if not data :
                 print("No activity for this user")
                 return False
             
-            self.events = [GithubEvent(event_data) for event_data in data ]
+            #github timestamps are fixed-width ISO strings, so they order lexicographically
+            #and old events can be dropped before any parsing happens
+            #(non-string timestamps are left to from_json's unknown-date fallback)
+            cutoff = (_utc_now() - timedelta(days=self.MAX_AGE_DAYS)).strftime("%Y-%m-%dT%H:%M:%SZ")
+            self.events = [
+                GithubEvent.from_json(event_data) for event_data in data
+                if not isinstance(ts := event_data.get("created_at"), str) or ts >= cutoff
+            ]
             #saving new data for the user
-            self.memory_cache[cache_key] = (self.events , datetime.now())
-            self.save_to_file_cache(self.events)
+            etag = response_headers.get("ETag")
+            self.remember(self.events, etag)
+            self.save_to_file_cache(self.events, etag)
             return True
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                print(f"Error: User '{self.username}' not found")
-            else:
-                print(f"API Error: {e.code}")
-            return False
         except Exception as e:
             print(f"Error: {e}")
             return False
-    def set_sort_strategy(self , strat:SortStrat) -> None:
-        self.sortStrategy = strat
+
+    def remember(self, events: List[GithubEvent], etag: Optional[str] = None) -> None:
+        with self.memory_lock:
+            self.memory_cache[self.username] = (events, datetime.now(), etag)
+            self.memory_cache.move_to_end(self.username)
+            if len(self.memory_cache) > self.MAX_USERS:
+                self.memory_cache.popitem(last=False)
+
+    @classmethod
+    def fetch_many(cls, usernames: List[str]) -> Dict[str, "Request"]:
+        #fetching is network bound, so threads overlap the round-trips;
+        #users that failed to load are left out of the result
+        requests = {name: cls(name) for name in dict.fromkeys(usernames)}
+        fetched = list(cls.get_pool().map(cls.fetch, requests.values()))
+        return {name: req for (name, req), ok in zip(requests.items(), fetched) if ok}
+
+    @classmethod
+    def get_pool(cls) -> "ThreadPoolExecutor":
+        with cls._pool_lock:
+            if cls._pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                cls._pool = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS)
+            return cls._pool
+
+    @classmethod
+    def shutdown_pool(cls) -> None:
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def get_connection(cls) -> "http.client.HTTPSConnection":
+        #one keep-alive connection per thread, so repeat fetches skip the TCP+TLS handshake
+        conn = getattr(cls._connections, "conn", None)
+        if conn is None:
+            import http.client
+            import urllib.request
+            from urllib.parse import urlsplit, unquote
+
+            #HTTPS_PROXY / https_proxy, like urlopen: connect to the proxy and CONNECT through it
+            proxy = urllib.request.getproxies().get("https")
+            if proxy and not urllib.request.proxy_bypass(cls.API_HOST):
+                parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+                port = parts.port or (443 if parts.scheme == "https" else 80)
+                conn = http.client.HTTPSConnection(parts.hostname, port, timeout=cls.TIMEOUT)
+                tunnel_headers = {}
+                if parts.username:
+                    import base64
+
+                    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+                    tunnel_headers["Proxy-Authorization"] = (
+                        "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+                    )
+                conn.set_tunnel(cls.API_HOST, headers=tunnel_headers)
+            else:
+                conn = http.client.HTTPSConnection(cls.API_HOST, timeout=cls.TIMEOUT)
+            cls._connections.conn = conn
+        return conn
+
+    def http_get(self, headers: Dict[str, str]) -> Tuple[int, "http.client.HTTPMessage", bytes]:
+        status, response_headers, raw = self._get(self.path, headers)
+        location = response_headers.get("Location")
+        if status in self.REDIRECT_STATUSES and location:
+            #renamed accounts answer with a redirect, follow it once like urlopen would
+            from urllib.parse import urlsplit
+
+            target = urlsplit(location)
+            if target.netloc and target.netloc != self.API_HOST:
+                return self._get_other_host(location, headers)
+            path = target.path + (f"?{target.query}" if target.query else "")
+            status, response_headers, raw = self._get(path, headers)
+        return status, response_headers, raw
+
+    def _get(self, path: str, headers: Dict[str, str]) -> Tuple[int, "http.client.HTTPMessage", bytes]:
+        import http.client
+
+        conn = self.get_connection()
+        for attempt in range(2):
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                return response.status, response.headers, response.read()
+            except (ConnectionError, http.client.HTTPException):
+                #github closes idle keep-alive connections, reconnect once and retry
+                conn.close()
+                if attempt:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+
+    def _get_other_host(self, url: str, headers: Dict[str, str]) -> Tuple[int, "http.client.HTTPMessage", bytes]:
+        #a redirect off api.github.com is rare enough to go through urlopen (proxies and all)
+        import urllib.request
+        import urllib.error
+
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.TIMEOUT) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, e.read()
+
+    def set_sort_mode(self , mode: str) -> None:
+        self.sort_mode = mode
     def get_sorted_events(self) -> List[GithubEvent]:
-        return self.sortStrategy.sort(self.events)
+        #the events endpoint already returns newest first and both caches keep that order;
+        #still copy, self.events is the list shared through memory_cache
+        if self.sort_mode == self.SERVER_ORDER:
+            return list(self.events)
+        return sort_events(self.events, self.sort_mode)
+
+    def get_top(self, limit: int, events: Optional[List[GithubEvent]] = None) -> List[GithubEvent]:
+        #only the first `limit` rows get shown, so select them in O(n log limit)
+        #instead of sorting everything; `events` must keep the server order
+        if events is None:
+            events = self.events
+        if self.sort_mode == self.SERVER_ORDER:
+            return events[:limit]
+        key, reverse = SORT_KEYS[self.sort_mode]
+        pick = heapq.nlargest if reverse else heapq.nsmallest
+        return pick(limit, events, key=key)
 
     def get_cache_path(self) -> Path:
-        return self.CACHE_DIR/f"{self.username}.json"
+        return self.cache_path
 
-    def load_from_file_cache(self) -> Optional[List[GithubEvent]]:
+    def load_from_file_cache(self) -> Optional[Tuple[List[GithubEvent], datetime, Optional[str]]]:
+        #returns (events, cache time, etag) even if the entry is past its TTL,
+        #the caller decides whether to use it directly or revalidate it
         cache_path = self.get_cache_path()
         if not cache_path.exists():
             return None
         try:
-            with open(cache_path , 'r') as f:
-                cache_data = json.load(f)
-                cache_time = datetime.fromisoformat(cache_data['timestamp'])
-
-                if datetime.now() - cache_time < self.TTL:
-                    return [GithubEvent(event) for event in cache_data['events']]
+            raw = cache_path.read_bytes()
+            if zstandard is not None:
+                raw = zstandard.ZstdDecompressor().decompress(raw)
+            cache_data = pickle.loads(raw)
+            columns = cache_data['columns']
+            events = list(map(GithubEvent, *(columns[name] for name in CACHE_COLUMNS)))
+            return events, cache_data['timestamp'], cache_data.get('etag')
         except Exception:
             pass #бляяя , лан похуй
         return None
 
-    def save_to_file_cache(self , events: List[GithubEvent] ) -> None:
-        #rrecursively transforms data types into json-compatible
-        def convert_to_json_serializable(obj):
-            if isinstance(obj, set):
-                return list(obj)
-            elif isinstance(obj, dict):
-                return {k: convert_to_json_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_json_serializable(item) for item in obj]
-            elif obj is None:
-                return None
-            elif isinstance(obj, (str, int, float, bool)):
-                return obj
-            else:
-                return str(obj)
-
-        
-        cache_path = self.get_cache_path()
-        temp_path = cache_path.with_suffix('.tmp')
+    def save_to_file_cache(self , events: List[GithubEvent] , etag: Optional[str] = None) -> None:
+        temp_path = self.temp_path
         try:
-            cache_data = { 
-             'timestamp': datetime.now().isoformat(),
-             'events': [
-                {
-                'type': e.type,
-                'repo': {'name' : e.repo_name},
-                'actor': {'login' : e.actor},
-                'created_at' : e.created_at.isoformat(),
-                'payload' : convert_to_json_serializable(e.payload)
-            }for e in events 
-        ]
-    }
-            cache_data = convert_to_json_serializable(cache_data)
-        
+            cache_data = {
+                'timestamp': datetime.now(),
+                'etag': etag,
+                #one flat list per field instead of pickling every event object
+                'columns': {name: list(map(attrgetter(name), events)) for name in CACHE_COLUMNS},
+            }
          #ensuring that file is written completely (in case with no mistakes) 
          # , or not at all in case of a mistake 
-            with open(temp_path , 'w') as f:
-                json.dump(cache_data , f)
-            temp_path.replace(cache_path)
+            raw = pickle.dumps(cache_data, protocol=5)
+            if zstandard is not None:
+                raw = zstandard.ZstdCompressor(level=3).compress(raw)
+            data = memoryview(raw)
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            os.replace(temp_path, self.cache_path)
         except Exception as e: 
             print(f"Error saving cache : {e}")
             if  temp_path.exists():
                  temp_path.unlink()
 
 
-STATS_DAYS = 30
+STATS_DAYS = Request.MAX_AGE_DAYS
+EVENT_LIST_LIMIT = 25
+RESIZE_DEBOUNCE_MS = 120
+LOAD_POLL_MS = 50
 UI_SORT_OPTIONS = [
-    ("By Date (newest first)", SortByDate),
-    ("By Repository", SortByRepository),
-    ("By Event Type", SortByType),
+    ("By Date (newest first)", "date"),
+    ("By Repository", "repo"),
+    ("By Event Type", "type"),
 ]
 
 
 def filter_recent_events(events: List[GithubEvent], days: int) -> List[GithubEvent]:
-    cutoff = datetime.now() - timedelta(days=days)
-    return [e for e in events if e.created_at != datetime.min and e.created_at >= cutoff]
+    #int compares instead of datetime ones; unknown dates (-1) are always before the cutoff
+    cutoff = _epoch_seconds(_utc_now() - timedelta(days=days))
+    return [e for e in events if e.created_ts >= cutoff]
+
 
+#event type -> stats label; push events add their commit count instead of 1
+_STAT_BUCKETS = {
+    _PULL_REQUEST: "Pull requests",
+    _ISSUES: "Issues",
+    _WATCH: "Stars / Watches",
+    _FORK: "Forks",
+    _CREATE: "Creates",
+    _DELETE: "Deletes",
+}
 
-def aggregate_stats(events: List[GithubEvent], days: int) -> Optional[Dict[str, int]]:
-    recent_events = filter_recent_events(events, days)
 
+def aggregate_stats(recent_events: List[GithubEvent]) -> Optional[Dict[str, int]]:
+    #takes the events already cut down by filter_recent_events, so callers filter once
     if not recent_events:
         return None
 
-    stats: Dict[str, int] = Counter()
-
+    push = _PUSH
+    buckets = _STAT_BUCKETS
+    stats: Dict[str, int] = {}
+    commits = 0
+    has_push = False
+    #one pass: pushes add their commit count, every other event weighs 1
     for e in recent_events:
-        if e.type == EventType.PUSH.value:
-            stats["Commits"] += max(getattr(e, "commit_count", 0), 0)
-        elif e.type == EventType.PULL_REQUEST.value:
-            stats["Pull requests"] += 1
-        elif e.type == EventType.ISSUES.value:
-            stats["Issues"] += 1
-        elif e.type == EventType.WATCH.value:
-            stats["Stars / Watches"] += 1
-        elif e.type == EventType.FORK.value:
-            stats["Forks"] += 1
-        elif e.type == EventType.CREATE.value:
-            stats["Creates"] += 1
-        elif e.type == EventType.DELETE.value:
-            stats["Deletes"] += 1
+        event_type = e.type
+        if event_type == push:
+            commits += e.commit_count
+            has_push = True
         else:
-            stats["Other"] += 1
+            label = buckets.get(event_type, "Other")
+            stats[label] = stats.get(label, 0) + 1
+
+    #"Commits" stays the first label, the chart colours follow the label order
+    return {"Commits": commits, **stats} if has_push else stats
 
-    return dict(stats)
 
+#figures of closed stats windows keyed by the stats they show, labels in order
+#(the colours follow it): the same stats reuse a figure as is, other stats clear
+#and redraw one instead of building a new one; only the newest few are kept
+_IDLE_FIGURES: Dict[Tuple[Tuple[str, int], ...], "Figure"] = {}
+MAX_IDLE_FIGURES = 2
+_IDLE_FIGURES_LOCK = threading.Lock()
+
+
+def build_figure_from_stats(stats: Dict[str, int], fig: Optional["Figure"] = None) -> "Figure":
+    from matplotlib.figure import Figure
 
-def build_figure_from_stats(stats: Dict[str, int]) -> Figure:
     labels = list(stats.keys())
     values = list(stats.values())
 
-    fig = Figure(figsize=(14, 7), dpi=100, facecolor="#fafafa")
+    if fig is None:
+        fig = Figure(figsize=(14, 7), dpi=100, facecolor="#fafafa")
+    else:
+        fig.clear()
     ax_pie, ax_bar = fig.subplots(
         1, 2, gridspec_kw={"width_ratios": [1.1, 1]}, squeeze=True
     )
@@ -306,6 +621,37 @@ def build_figure_from_stats(stats: Dict[str, int]) -> Figure:
     return fig
 
 
+def acquire_figure(stats: Dict[str, int]) -> "Figure":
+    key = tuple(stats.items())
+    with _IDLE_FIGURES_LOCK:
+        fig = _IDLE_FIGURES.pop(key, None)
+        if fig is not None:
+            return fig
+        if _IDLE_FIGURES:
+            fig = _IDLE_FIGURES.pop(next(iter(_IDLE_FIGURES)))
+    return build_figure_from_stats(stats, fig)
+
+
+def release_figure(stats: Dict[str, int], fig: "Figure") -> None:
+    key = tuple(stats.items())
+    with _IDLE_FIGURES_LOCK:
+        #re-insert so the newest figure is last, then drop the oldest past the cap
+        _IDLE_FIGURES.pop(key, None)
+        _IDLE_FIGURES[key] = fig
+        while len(_IDLE_FIGURES) > MAX_IDLE_FIGURES:
+            del _IDLE_FIGURES[next(iter(_IDLE_FIGURES))]
+
+
+def prepare_stats(request: Request) -> Tuple[List[GithubEvent], Optional[Dict[str, int]], Optional["Figure"]]:
+    #no Tk calls in here, so it can run on the worker together with the fetch
+    events = request.events
+    recent_events = filter_recent_events(events, STATS_DAYS)
+    stats = aggregate_stats(recent_events)
+    display_events = request.get_top(EVENT_LIST_LIMIT, recent_events or events)
+    fig = acquire_figure(stats) if stats else None
+    return display_events, stats, fig
+
+
 def center_window(window, width: int, height: int) -> None:
     #Position a Tk window roughly in the center of the screen.
     
@@ -317,26 +663,42 @@ def center_window(window, width: int, height: int) -> None:
     window.geometry(f"{width}x{height}+{x}+{y}")
 
 
+#login is the first path segment after github.com, without any query or fragment
+_PROFILE_RE = re.compile(r"github\.com/+([^/\s?#]+)")
+
+
 def parse_username(value: str) -> str:
     value = (value or "").strip()
     if not value:
         return ""
-    if "github.com" in value:
-        part = value.split("github.com", 1)[1]
-        part = part.lstrip("/ ")
-        if "/" in part:
-            part = part.split("/", 1)[0]
-        return part.strip()
-    return value
+    match = _PROFILE_RE.search(value)
+    if match:
+        value = match.group(1)
+    elif "github.com" in value:
+        #a github link without a login in it
+        return ""
+    return value if is_valid_login(value) else ""
 
 
-def show_stats_window(root: tk.Tk, request: Request, sort_label: str) -> None:
-    events = request.get_sorted_events()
-    recent_events = filter_recent_events(events, STATS_DAYS)
-    stats = aggregate_stats(events, STATS_DAYS)
+def load_users(usernames: List[str], sort_mode: str) -> Dict[str, Request]:
+    #safe to run off the Tk thread: no widgets are touched here
+    if len(usernames) == 1:
+        req = Request(usernames[0], sort_mode)
+        return {req.username: req} if req.fetch() else {}
+    #several users: fetch them concurrently on Request's shared pool, whose threads
+    #keep their keep-alive connections from one click to the next
+    loaded = Request.fetch_many(usernames)
+    for req in loaded.values():
+        req.set_sort_mode(sort_mode)
+    return loaded
+
+
+def open_stats_window(root: "tk.Tk", username: str) -> "tk.Toplevel":
+    import tkinter as tk
+    from tkinter import ttk
 
     win = tk.Toplevel(root)
-    win.title(f"Activity stats: {request.username}")
+    win.title(f"Activity stats: {username}")
     width, height = 1200, 800
     win.geometry(f"{width}x{height}")
     center_window(win, width, height)
@@ -353,10 +715,29 @@ def show_stats_window(root: tk.Tk, request: Request, sort_label: str) -> None:
 
     ttk.Label(
         info_frame,
-        text=f"User: {request.username} | Period: last {STATS_DAYS} days",
+        text=f"User: {username} | Period: last {STATS_DAYS} days",
         font=("TkDefaultFont", 12, "bold"),
     ).grid(row=0, column=0, sticky="w")
 
+    # placeholder until show_stats_window fills the window in
+    ttk.Label(win, text="Loading...").grid(row=1, column=0, pady=20)
+    return win
+
+
+def show_stats_window(
+    win: "tk.Toplevel",
+    request: Request,
+    sort_label: str,
+    prepared: Optional[Tuple[List[GithubEvent], Optional[Dict[str, int]], Optional["Figure"]]] = None,
+) -> None:
+    from tkinter import ttk
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    display_events, stats, fig = prepared if prepared is not None else prepare_stats(request)
+
+    for widget in win.grid_slaves(row=1):
+        widget.destroy()
+
     if not stats:
         ttk.Label(
             win,
@@ -370,21 +751,40 @@ def show_stats_window(root: tk.Tk, request: Request, sort_label: str) -> None:
     chart_frame.rowconfigure(0, weight=1)
     chart_frame.columnconfigure(0, weight=1)
 
-    fig = build_figure_from_stats(stats)
     fig_canvas = FigureCanvasTkAgg(fig, master=chart_frame)
+
+    def on_destroy(event):
+        # <Destroy> also fires for every child widget
+        if event.widget is win:
+            release_figure(stats, fig)
+
+    win.bind("<Destroy>", on_destroy, add="+")
     fig_widget = fig_canvas.get_tk_widget()
     fig_widget.configure(bg="#fafafa", highlightthickness=0)
     fig_widget.grid(row=0, column=0, sticky="nsew")
 
-    def on_chart_resize(event):
-        if event.width <= 0 or event.height <= 0:
+    resize_job = None
+
+    def resize_chart(width, height):
+        nonlocal resize_job
+        resize_job = None
+        if not win.winfo_exists():
             return
         dpi = fig.get_dpi()
-        w = max(event.width, 200)
-        h = max(event.height, 200)
+        w = max(width, 200)
+        h = max(height, 200)
         fig.set_size_inches(w / dpi, h / dpi, forward=True)
         fig_canvas.draw_idle()
 
+    def on_chart_resize(event):
+        nonlocal resize_job
+        if event.width <= 0 or event.height <= 0:
+            return
+        # tk fires <Configure> continuously while dragging, redraw once it settles
+        if resize_job is not None:
+            win.after_cancel(resize_job)
+        resize_job = win.after(RESIZE_DEBOUNCE_MS, resize_chart, event.width, event.height)
+
     chart_frame.bind("<Configure>", on_chart_resize)
 
     list_frame = ttk.Frame(win, padding=(12, 8))
@@ -392,76 +792,33 @@ def show_stats_window(root: tk.Tk, request: Request, sort_label: str) -> None:
     list_frame.rowconfigure(1, weight=1)
     list_frame.columnconfigure(0, weight=1)
 
-    style = ttk.Style(win)
-    style.configure("Activity.Time.TLabel", font=("TkDefaultFont", 10, "bold"))
-    style.configure("Activity.Event.TLabel", font=("TkDefaultFont", 10))
-
     ttk.Label(
         list_frame,
         text=f"Recent events (sorted: {sort_label})",
         font=("TkDefaultFont", 11, "bold"),
     ).grid(row=0, column=0, sticky="w", pady=(0, 6))
 
-    list_canvas = tk.Canvas(list_frame, highlightthickness=0, bg="#ffffff")
-    yscroll = ttk.Scrollbar(list_frame, orient="vertical", command=list_canvas.yview)
-    list_canvas.configure(yscrollcommand=yscroll.set)
+    # Treeview only draws the visible rows, one widget for the whole list
+    tree = ttk.Treeview(list_frame, columns=("time", "event"), show="headings", height=10)
+    tree.heading("time", text="Time", anchor="w")
+    tree.heading("event", text="Event", anchor="w")
+    tree.column("time", width=180, minwidth=140, stretch=False, anchor="w")
+    tree.column("event", width=900, anchor="w")
+    yscroll = ttk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+    tree.configure(yscrollcommand=yscroll.set)
 
-    list_canvas.grid(row=1, column=0, sticky="nsew")
+    tree.grid(row=1, column=0, sticky="nsew")
     yscroll.grid(row=1, column=1, sticky="ns")
 
-    inner = ttk.Frame(list_canvas, padding=4)
-    inner_window = list_canvas.create_window((0, 0), window=inner, anchor="nw")
-
-    def on_inner_config(event):
-        list_canvas.configure(scrollregion=list_canvas.bbox("all"))
-        canvas_width = list_canvas.winfo_width()
-        if canvas_width > 0:
-            list_canvas.itemconfig(inner_window, width=canvas_width)
-
-    inner.bind("<Configure>", on_inner_config)
-    list_canvas.update_idletasks()
-
-    def on_mousewheel(event):
-        if event.num == 4:
-            delta = -1
-        elif event.num == 5:
-            delta = 1
-        else:
-            delta = -1 if event.delta > 0 else 1
-        list_canvas.yview_scroll(delta, "units")
-        return "break"
-
-    for widget in (list_canvas, inner, win):
-        widget.bind("<MouseWheel>", on_mousewheel, add="+")
-        widget.bind("<Button-4>", on_mousewheel, add="+")
-        widget.bind("<Button-5>", on_mousewheel, add="+")
-
-    display_events = recent_events or events
-    for idx, event in enumerate(display_events[:25]):
-        row = ttk.Frame(inner, padding=(10, 6))
-        row.pack(fill=tk.X, pady=(0, 6))
-
-        time_label = ttk.Label(
-            row,
-            text=event.format_date(),
-            style="Activity.Time.TLabel",
-            width=22,
-            anchor="w",
-        )
-        time_label.pack(side=tk.LEFT, anchor="w")
-
-        event_label = ttk.Label(
-            row,
-            text=event.format(),
-            style="Activity.Event.TLabel",
-            anchor="w",
-            wraplength=900,
-            justify="left",
-        )
-        event_label.pack(side=tk.LEFT, anchor="w", fill=tk.X, expand=True, padx=(10, 0))
+    for event in display_events:
+        tree.insert("", "end", values=(event.formatted_date, event.formatted_text))
 
 
 def run_ui() -> None:
+    import tkinter as tk
+    from tkinter import ttk, messagebox
+    from concurrent.futures import ThreadPoolExecutor
+
     root = tk.Tk()
     root.title("Github Activity")
     width, height = 720, 480
@@ -486,9 +843,9 @@ def run_ui() -> None:
         font=("TkDefaultFont", 12, "bold"),
     ).pack(anchor="center", pady=(0, 6))
 
-    ttk.Label(main_frame, text="Enter GitHub username or profile link:").pack(
-        anchor="w"
-    )
+    ttk.Label(
+        main_frame, text="Enter GitHub usernames or profile links (comma-separated):"
+    ).pack(anchor="w")
 
     username_var = tk.StringVar()
     entry = ttk.Entry(main_frame, textvariable=username_var)
@@ -505,25 +862,65 @@ def run_ui() -> None:
     )
     sort_box.pack(fill=tk.X, pady=4)
 
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    def load_and_prepare(usernames, sort_mode):
+        #stats and the matplotlib figure are built here too, off the Tk thread
+        loaded = load_users(usernames, sort_mode)
+        return {name: (req, prepare_stats(req)) for name, req in loaded.items()}
+
     def on_show():
+        if btn.instate(["disabled"]):
+            return
         raw_value = username_var.get()
-        username = parse_username(raw_value)
-        if not username:
+        usernames = [name for name in map(parse_username, raw_value.split(",")) if name]
+        if not usernames:
             messagebox.showerror("Error", "Enter a valid username or profile link.")
             return
 
-        req = Request(username)
         selected_label = sort_var.get()
-        for label, strat_cls in UI_SORT_OPTIONS:
+        sort_mode = UI_SORT_OPTIONS[0][1]
+        for label, mode in UI_SORT_OPTIONS:
             if label == selected_label:
-                req.set_sort_strategy(strat_cls())
+                sort_mode = mode
                 break
 
-        if not req.fetch():
-            messagebox.showerror("Error", f"Failed to load data for '{username}'.")
-            return
-
-        show_stats_window(root, req, selected_label)
+        #the network round-trip runs on a worker so the window keeps responding;
+        #tk isn't thread-safe, so the main thread polls for the result
+        btn.state(["disabled"])
+        future = executor.submit(load_and_prepare, usernames, sort_mode)
+        #the empty windows are laid out while the worker fetches
+        windows = {name: open_stats_window(root, name) for name in dict.fromkeys(usernames)}
+
+        def on_loaded():
+            if not future.done():
+                root.after(LOAD_POLL_MS, on_loaded)
+                return
+            btn.state(["!disabled"])
+            try:
+                loaded = future.result()
+            except Exception as e:
+                for win in windows.values():
+                    win.destroy()
+                messagebox.showerror("Error", f"Failed to load data: {e}")
+                return
+
+            failed = [name for name in windows if name not in loaded]
+            for name in failed:
+                windows[name].destroy()
+            if failed:
+                names = ", ".join(f"'{name}'" for name in failed)
+                messagebox.showerror("Error", f"Failed to load data for {names}.")
+
+            for name, (req, prepared) in loaded.items():
+                win = windows[name]
+                if win.winfo_exists():
+                    show_stats_window(win, req, selected_label, prepared)
+                elif prepared[2] is not None:
+                    # closed while loading, keep the figure for the next window
+                    release_figure(prepared[1], prepared[2])
+
+        root.after(LOAD_POLL_MS, on_loaded)
 
     btn = ttk.Button(main_frame, text="Show stats", command=on_show)
     btn.pack(pady=10)
@@ -532,6 +929,8 @@ def run_ui() -> None:
     entry.bind("<KP_Enter>", lambda _: on_show())
 
     root.mainloop()
+    executor.shutdown(wait=False, cancel_futures=True)
+    Request.shutdown_pool()
 
 
 if __name__ == "__main__" :